@@ -8,6 +8,7 @@ from __future__ import annotations
 import os.path
 
 from io import BytesIO
+from mmap import ACCESS_READ
 from pathlib import Path
 from platform import python_implementation, system
 from typing import Any
@@ -15,7 +16,9 @@ from typing import Any
 import pytest
 
 from tinytag import TinyTag, TinyTagException
-from tinytag.tinytag import _ID3, _Ogg, _Wave, _Flac, _Wma, _MP4, _Aiff
+from tinytag.tinytag import (
+    _ID3, _Ogg, _Wave, _Flac, _Wma, _MP4, _Aiff, _MappedFile
+)
 
 
 TEST_FILES = dict([
@@ -23,7 +26,7 @@ TEST_FILES = dict([
         'other': {},
         'channels': 2,
         'samplerate': 44100,
-        'duration': 0.47020408163265304,
+        'duration': 222.19755102040816,
         'album': 'I Can Walk On Water I Can Fly',
         'year': '2007',
         'title': 'I Can Walk On Water I Can Fly',
@@ -32,7 +35,7 @@ TEST_FILES = dict([
         'filesize': 8192,
         'genre': 'Dance',
         'comment': 'Ripped by THSLIVE',
-        'bitrate': 125.33333333333333,
+        'bitrate': 233.26042866799907,
     }),
     ('cbr.mp3', {
         'other': {},
@@ -1428,6 +1431,34 @@ def test_file_obj_compatibility() -> None:
         assert tag.filesize == tag_bytesio.filesize
 
 
+def test_cache() -> None:
+    cache: dict[str, TinyTag] = {}
+    filename = os.path.join(SAMPLE_FOLDER, 'cbr.mp3')
+    tag = TinyTag.get(filename, cache=cache)
+    assert len(cache) == 1
+    cached_tag = TinyTag.get(filename, cache=cache)
+    assert cached_tag is not tag
+    assert cached_tag.as_dict() == tag.as_dict()
+    TinyTag.get(filename, tags=False, cache=cache)
+    assert len(cache) == 2
+
+
+def test_mapped_file_seek() -> None:
+    filename = os.path.join(SAMPLE_FOLDER, 'cbr.mp3')
+    with open(filename, 'rb') as file_handle:
+        mapped_file = _MappedFile(
+            file_handle.fileno(), 0, access=ACCESS_READ)
+        try:
+            mapped_file.seek(-128, os.SEEK_END)
+            file_handle.seek(-128, os.SEEK_END)
+            assert mapped_file.tell() == file_handle.tell()
+            assert mapped_file.read(4) == file_handle.read(4)
+            mapped_file.seek(1000, os.SEEK_CUR)  # past the end
+            assert not mapped_file.read(4)
+        finally:
+            mapped_file.close()
+
+
 @pytest.mark.skipif(
     system() == 'Windows' and python_implementation() == 'PyPy',
     reason='PyPy on Windows not supported'
@@ -29,14 +29,18 @@
 """Audio file metadata reader."""
 
 from __future__ import annotations
-from binascii import a2b_base64
+from functools import lru_cache
 from io import BytesIO
-from os import PathLike, SEEK_CUR, SEEK_END, environ, fsdecode
-from struct import unpack
+from mmap import ACCESS_READ, mmap
+from os import (
+    PathLike, SEEK_CUR, SEEK_END, SEEK_SET, environ, fsdecode, fstat, stat)
+from re import compile as re_compile
+from struct import Struct, unpack
 
 # Lazy imports for type checking
 if False:  # pylint: disable=using-constant-test
-    from collections.abc import Callable, Iterator  # pylint: disable-all
+    from collections.abc import (  # pylint: disable-all
+        Callable, Iterator, MutableMapping)
     from typing import Any, BinaryIO, Dict, List
 
     _StringListDict = Dict[str, List[str]]
@@ -71,7 +75,10 @@ class TinyTag:
         '.aiff', '.aifc', '.aif', '.afc'
     )
     _OTHER_PREFIX = 'other.'
-    _file_extension_mapping: dict[tuple[str, ...], type[TinyTag]] | None = None
+    _MAGIC_HEADER_LEN = 35  # enough bytes for all file signatures below
+    _MP4_BRANDS = frozenset((b'M4A', b'M4B', b'aax'))
+    _MMAP_THRESHOLD = 4096  # memory map files larger than this
+    _file_extension_mapping: dict[str, type[TinyTag]] | None = None
 
     def __init__(self) -> None:
         self.filename: str | None = None
@@ -115,41 +122,72 @@ class TinyTag:
             duration: bool = True,
             image: bool = False,
             encoding: str | None = None,
-            ignore_errors: bool | None = None) -> TinyTag:
+            ignore_errors: bool | None = None,
+            cache: MutableMapping[str, TinyTag] | None = None) -> TinyTag:
         """Return a tag object for an audio file."""
+        if ignore_errors is not None:
+            # pylint: disable=import-outside-toplevel
+            from warnings import warn
+            warn('ignore_errors argument is obsolete, and will be removed in '
+                 'the future', DeprecationWarning, stacklevel=2)
         should_close_file = file_obj is None
         filename_str = None
+        mapped_file = None
+        cache_key = None
         if filename:
+            filename_str = fsdecode(filename)
+            if cache is not None:
+                # pylint: disable=import-outside-toplevel
+                from copy import deepcopy
+                file_stat = stat(filename)
+                cache_key = repr((
+                    filename_str, file_stat.st_mtime_ns, file_stat.st_size,
+                    tags, duration, image, encoding))
+                cached_tag = cache.get(cache_key)
+                if cached_tag is not None:
+                    return deepcopy(cached_tag)
             if should_close_file:
                 # pylint: disable=consider-using-with
                 file_obj = open(filename, 'rb')
-            filename_str = fsdecode(filename)
         if file_obj is None:
             raise ValueError(
                 'Either filename or file_obj argument is required')
-        if ignore_errors is not None:
-            # pylint: disable=import-outside-toplevel
-            from warnings import warn
-            warn('ignore_errors argument is obsolete, and will be removed in '
-                 'the future', DeprecationWarning, stacklevel=2)
         try:
             # pylint: disable=protected-access
-            file_obj.seek(0, SEEK_END)
-            filesize = file_obj.tell()
-            file_obj.seek(0)
+            # the file is only touched if the file extension is unknown
             parser_class = cls._get_parser_class(filename_str, file_obj)
+            if should_close_file:
+                # we opened the file ourselves, so its position is still
+                # at the start; one fstat call is cheaper than seeking
+                filesize = fstat(file_obj.fileno()).st_size
+            else:
+                file_obj.seek(0, SEEK_END)
+                filesize = file_obj.tell()
+                file_obj.seek(0)
             tag = parser_class()
             tag._filehandler = file_obj
             tag._default_encoding = encoding
             tag.filename = filename_str
             tag.filesize = filesize
+            if should_close_file and filesize > cls._MMAP_THRESHOLD:
+                try:
+                    mapped_file = _MappedFile(
+                        file_obj.fileno(), 0, access=ACCESS_READ)
+                    tag._filehandler = mapped_file  # type: ignore
+                except (OSError, ValueError):
+                    pass  # not mappable, keep reading from file object
             if filesize > 0:
                 try:
                     tag._load(tags=tags, duration=duration, image=image)
                 except Exception as exc:
                     raise ParseError(exc) from exc
+            if cache is not None and cache_key is not None:
+                tag._filehandler = None
+                cache[cache_key] = deepcopy(tag)
             return tag
         finally:
+            if mapped_file is not None:
+                mapped_file.close()
             if should_close_file:
                 file_obj.close()
 
@@ -188,35 +226,43 @@ class TinyTag:
     def _get_parser_for_filename(cls, filename: str) -> type[TinyTag] | None:
         if cls._file_extension_mapping is None:
             cls._file_extension_mapping = {
-                ('.mp1', '.mp2', '.mp3'): _ID3,
-                ('.oga', '.ogg', '.opus', '.spx'): _Ogg,
-                ('.wav',): _Wave,
-                ('.flac',): _Flac,
-                ('.wma',): _Wma,
-                ('.m4b', '.m4a', '.m4r', '.m4v', '.mp4',
-                 '.aax', '.aaxc'): _MP4,
-                ('.aiff', '.aifc', '.aif', '.afc'): _Aiff,
+                ext: tagclass
+                for exts, tagclass in (
+                    (('.mp1', '.mp2', '.mp3'), _ID3),
+                    (('.oga', '.ogg', '.opus', '.spx'), _Ogg),
+                    (('.wav',), _Wave),
+                    (('.flac',), _Flac),
+                    (('.wma',), _Wma),
+                    (('.m4b', '.m4a', '.m4r', '.m4v', '.mp4',
+                      '.aax', '.aaxc'), _MP4),
+                    (('.aiff', '.aifc', '.aif', '.afc'), _Aiff),
+                )
+                for ext in exts
             }
-        filename = filename.lower()
-        for ext, tagclass in cls._file_extension_mapping.items():
-            if filename.endswith(ext):
-                return tagclass
-        return None
+        dot_pos = filename.rfind('.')
+        if dot_pos == -1:
+            return None
+        return cls._file_extension_mapping.get(filename[dot_pos:].lower())
 
     @classmethod
     def _get_parser_for_file_handle(
         cls,
         filehandle: BinaryIO
     ) -> type[TinyTag] | None:
-        # https://en.wikipedia.org/wiki/List_of_file_signatures
-        header = filehandle.read(35)
         filehandle.seek(0)
-        if header.startswith(b'ID3') or header.startswith(b'\xff\xfb'):
+        header = filehandle.read(cls._MAGIC_HEADER_LEN)
+        filehandle.seek(0)
+        return cls._get_parser_for_header(header)
+
+    @classmethod
+    def _get_parser_for_header(cls, header: bytes) -> type[TinyTag] | None:
+        # https://en.wikipedia.org/wiki/List_of_file_signatures
+        if header.startswith((b'ID3', b'\xff\xfb')):
             return _ID3
         if header.startswith(b'fLaC'):
             return _Flac
         if ((header[4:8] == b'ftyp'
-             and header[8:11] in {b'M4A', b'M4B', b'aax'})
+             and header[8:11] in cls._MP4_BRANDS)
                 or b'\xff\xf1' in header):
             return _MP4
         if (header.startswith(b'OggS')
@@ -283,17 +329,18 @@ class TinyTag:
         old_value = self.__dict__.get(fieldname)
         new_value = value
         if isinstance(new_value, str):
-            # First value goes in tag, others in tag.other
-            values = new_value.split('\x00')
-            for index, i_value in enumerate(values):
-                if index or old_value and i_value != old_value:
-                    self._set_field(
-                        self._OTHER_PREFIX + fieldname, i_value,
-                        check_conflict=False)
-                    continue
-                new_value = i_value
-            if old_value:
-                return
+            if old_value or '\x00' in new_value:
+                # First value goes in tag, others in tag.other
+                values = new_value.split('\x00')
+                for index, i_value in enumerate(values):
+                    if index or old_value and i_value != old_value:
+                        self._set_field(
+                            self._OTHER_PREFIX + fieldname, i_value,
+                            check_conflict=False)
+                        continue
+                    new_value = i_value
+                if old_value:
+                    return
         elif not new_value and old_value:
             # Prioritize non-zero integer values
             return
@@ -326,6 +373,8 @@ class TinyTag:
     @staticmethod
     def _unpad(s: str) -> str:
         # certain strings *may* be terminated with a zero byte at the end
+        if not s or (s[0] != '\x00' and s[-1] != '\x00'):
+            return s
         return s.strip('\x00')
 
     def get_image(self) -> bytes | None:
@@ -357,6 +406,18 @@ class TinyTag:
         return {k: v[0] for k, v in self.other.items() if k in extra_keys}
 
 
+class _MappedFile(mmap):
+    """A read-only memory map of a file, seekable like a regular file."""
+
+    def seek(self, pos: int, whence: int = SEEK_SET) -> None:
+        # files allow seeking past the end, mmap raises an error instead
+        if whence == SEEK_CUR:
+            pos += self.tell()
+        elif whence == SEEK_END:
+            pos += len(self)
+        super().seek(min(pos, len(self)))
+
+
 class Images:
     """A class containing images embedded in an audio file."""
     _OTHER_PREFIX = 'other.'
@@ -478,19 +539,46 @@ class _MP4(TinyTag):
         13: 'image/jpeg',
         14: 'image/png'
     }
-    _UNPACK_FORMATS = {
-        1: '>b',
-        2: '>h',
-        4: '>i',
-        8: '>q'
+    _INT_STRUCTS = {
+        1: Struct('>b'),
+        2: Struct('>h'),
+        4: Struct('>i'),
+        8: Struct('>q')
     }
+    _UINT16 = Struct('>H')
+    _UINT32 = Struct('>I')
+    _UINT16_X3 = Struct('>3H')
+    _UINT32_X2 = Struct('>II')
+    _UINT32_UINT64 = Struct('>IQ')
+    _ATOM_HEADER = Struct('>I4s')
     _VERSIONED_ATOMS = {b'meta', b'stsd'}  # those have an extra 4 byte header
     _FLAGGED_ATOMS = {b'stsd'}  # these also have an extra 4 byte header
+    _IMAGE_ATOMS = {b'covr'}
+    _BUFFERED_ATOMS = {b'ilst'}  # containers that are read in one go
+    _MAX_BUFFERED_ATOM_SIZE = 65536
 
     _audio_data_tree: dict[bytes, Any] | None = None
     _meta_data_tree: dict[bytes, Any] | None = None
+    _full_data_tree: dict[bytes, Any] | None = None
 
     def _determine_duration(self, fh: BinaryIO) -> None:
+        if self._tags_parsed:
+            return  # audio properties were read together with the tags
+        self._read_atoms(fh, path=self._get_audio_data_tree())
+
+    def _parse_tag(self, fh: BinaryIO) -> None:
+        path = self._get_meta_data_tree()
+        if self._parse_duration:
+            # read tags and audio properties in a single pass
+            if _MP4._full_data_tree is None:
+                _MP4._full_data_tree = self._merge_trees(
+                    path, self._get_audio_data_tree())
+            path = _MP4._full_data_tree
+        self._read_atoms(fh, path=path)
+        self._tags_parsed = True
+
+    @classmethod
+    def _get_audio_data_tree(cls) -> dict[bytes, Any]:
         # https://developer.apple.com/library/mac/documentation/QuickTime/QTFF/QTFFChap3/qtff3.html
         if _MP4._audio_data_tree is None:
             _MP4._audio_data_tree = {
@@ -502,9 +590,10 @@ class _MP4(TinyTag):
                     }}}}}
                 }
             }
-        self._traverse_atoms(fh, path=_MP4._audio_data_tree)
+        return _MP4._audio_data_tree
 
-    def _parse_tag(self, fh: BinaryIO) -> None:
+    @classmethod
+    def _get_meta_data_tree(cls) -> dict[bytes, Any]:
         # The parser tree: Each key is an atom name which is traversed if
         # existing. Leaves of the parser tree are callables which receive
         # the atom data. Callables return {fieldname: value} which is updates
@@ -539,25 +628,42 @@ class _MP4(TinyTag):
                 b'covr': {b'data': _MP4._parse_cover_image},
                 b'----': _MP4._parse_custom_field,
             }}}}}
-        self._traverse_atoms(fh, path=_MP4._meta_data_tree)
+        return _MP4._meta_data_tree
+
+    @classmethod
+    def _merge_trees(cls,
+                     tree: dict[bytes, Any],
+                     other: dict[bytes, Any]) -> dict[bytes, Any]:
+        merged = dict(tree)
+        for atom_type, sub_path in other.items():
+            if isinstance(sub_path, dict) and atom_type in merged:
+                sub_path = cls._merge_trees(merged[atom_type], sub_path)
+            merged[atom_type] = sub_path
+        return merged
+
+    def _read_atoms(self, fh: BinaryIO, path: dict[bytes, Any]) -> None:
+        if isinstance(fh, _MappedFile):
+            # walk the memory map directly, without any reads or seeks
+            with memoryview(fh) as data:
+                self._traverse_atoms_buffer(data, path, fh.tell())
+            return
+        self._traverse_atoms(fh, path)
 
     def _traverse_atoms(self,
                         fh: BinaryIO,
                         path: dict[bytes, Any],
                         stop_pos: int | None = None,
-                        curr_path: list[bytes] | None = None) -> None:
+                        depth: int = 1) -> None:
         header_len = 8
         atom_header = fh.read(header_len)
         while len(atom_header) == header_len:
-            atom_size = unpack('>I', atom_header[:4])[0] - header_len
+            atom_size = self._UINT32.unpack_from(atom_header)[0] - header_len
             atom_type = atom_header[4:]
-            if curr_path is None:  # keep track how we traversed in the tree
-                curr_path = [atom_type]
             if atom_size <= 0:  # empty atom, jump to next one
                 atom_header = fh.read(header_len)
                 continue
             if _DEBUG:
-                print(f'{" " * 4 * len(curr_path)} '
+                print(f'{" " * 4 * depth} '
                       f'pos: {fh.tell() - header_len} '
                       f'atom: {atom_type!r} len: {atom_size + header_len}')
             if atom_type in self._VERSIONED_ATOMS:  # jump atom version for now
@@ -565,23 +671,24 @@ class _MP4(TinyTag):
             if atom_type in self._FLAGGED_ATOMS:  # jump atom flags for now
                 fh.seek(4, SEEK_CUR)
             sub_path = path.get(atom_type, None)
+            if atom_type in self._IMAGE_ATOMS and not self._load_image:
+                sub_path = None  # skip image data without reading it
             # if the path leaf is a dict, traverse deeper into the tree:
             if isinstance(sub_path, dict):
-                atom_end_pos = fh.tell() + atom_size
-                self._traverse_atoms(fh, path=sub_path, stop_pos=atom_end_pos,
-                                     curr_path=curr_path + [atom_type])
+                if (atom_type in self._BUFFERED_ATOMS
+                        and atom_size <= self._MAX_BUFFERED_ATOM_SIZE):
+                    # read small containers at once and walk them in memory
+                    self._traverse_atoms_buffer(
+                        fh.read(atom_size), path=sub_path, pos=0,
+                        depth=depth + 1)
+                else:
+                    atom_end_pos = fh.tell() + atom_size
+                    self._traverse_atoms(
+                        fh, path=sub_path, stop_pos=atom_end_pos,
+                        depth=depth + 1)
             # if the path-leaf is a callable, call it on the atom data
             elif callable(sub_path):
-                for fieldname, value in sub_path(fh.read(atom_size)).items():
-                    if _DEBUG:
-                        print(' ' * 4 * len(curr_path), 'FIELD: ', fieldname)
-                    if fieldname.startswith('images.'):
-                        if self._load_image:
-                            # pylint: disable=protected-access
-                            self.images._set_field(
-                                fieldname[len('images.'):], value)
-                    elif fieldname:
-                        self._set_field(fieldname, value)
+                self._set_atom_fields(sub_path(fh.read(atom_size)), depth)
             # if no action was specified using dict or callable, jump over atom
             else:
                 fh.seek(atom_size, SEEK_CUR)
@@ -590,6 +697,64 @@ class _MP4(TinyTag):
                 return  # return to parent (next parent node in tree)
             atom_header = fh.read(header_len)  # read next atom
 
+    def _traverse_atoms_buffer(self,
+                               data: bytes | memoryview,
+                               path: dict[bytes, Any],
+                               pos: int,
+                               stop_pos: int | None = None,
+                               depth: int = 1) -> int:
+        # same as _traverse_atoms, but operating on an in-memory buffer,
+        # returns the position after the last atom traversed
+        header_len = 8
+        data_len = len(data)
+        while pos + header_len <= data_len:
+            atom_size, atom_type = self._ATOM_HEADER.unpack_from(data, pos)
+            atom_size -= header_len
+            pos += header_len
+            if atom_size <= 0:  # empty atom, jump to next one
+                continue
+            if _DEBUG:
+                print(f'{" " * 4 * depth} '
+                      f'pos: {pos - header_len} '
+                      f'atom: {atom_type!r} len: {atom_size + header_len}')
+            if atom_type in self._VERSIONED_ATOMS:  # jump atom version for now
+                pos += 4
+            if atom_type in self._FLAGGED_ATOMS:  # jump atom flags for now
+                pos += 4
+            sub_path = path.get(atom_type, None)
+            if atom_type in self._IMAGE_ATOMS and not self._load_image:
+                sub_path = None  # skip image data without reading it
+            # if the path leaf is a dict, traverse deeper into the tree:
+            if isinstance(sub_path, dict):
+                pos = self._traverse_atoms_buffer(
+                    data, path=sub_path, pos=pos, stop_pos=pos + atom_size,
+                    depth=depth + 1)
+            # if the path-leaf is a callable, call it on the atom data
+            elif callable(sub_path):
+                atom_data = bytes(data[pos:pos + atom_size])
+                pos += len(atom_data)
+                self._set_atom_fields(sub_path(atom_data), depth)
+            # if no action was specified using dict or callable, jump over atom
+            else:
+                pos = min(pos + atom_size, data_len)
+            # check if we have reached the end of this branch:
+            if stop_pos and pos >= stop_pos:
+                break  # return to parent (next parent node in tree)
+        return min(pos, data_len)
+
+    def _set_atom_fields(self,
+                         fields: dict[str, Any],
+                         depth: int) -> None:
+        for fieldname, value in fields.items():
+            if _DEBUG:
+                print(' ' * 4 * depth, 'FIELD: ', fieldname)
+            if fieldname.startswith('images.'):
+                if self._load_image:
+                    # pylint: disable=protected-access
+                    self.images._set_field(fieldname[len('images.'):], value)
+            elif fieldname:
+                self._set_field(fieldname, value)
+
     @classmethod
     def _data_parser(
         cls, fieldname: str
@@ -597,16 +762,15 @@ class _MP4(TinyTag):
         def _parse_data_atom(
             data_atom: bytes
         ) -> dict[str, int | str | bytes | None]:
-            data_type = unpack('>I', data_atom[:4])[0]
+            data_type = cls._UINT32.unpack_from(data_atom)[0]
             data = data_atom[8:]
             value = None
             if data_type == 1:     # UTF-8 string
                 value = data.decode('utf-8', 'replace')
             elif data_type == 21:  # BE signed integer
-                fmts = cls._UNPACK_FORMATS
-                data_len = len(data)
-                if data_len in fmts:
-                    value = str(unpack(fmts[data_len], data)[0])
+                int_struct = cls._INT_STRUCTS.get(len(data))
+                if int_struct is not None:
+                    value = str(int_struct.unpack(data)[0])
             return {fieldname: value}
         return _parse_data_atom
 
@@ -615,8 +779,7 @@ class _MP4(TinyTag):
         cls, fieldname1: str, fieldname2: str
     ) -> Callable[[bytes], dict[str, int]]:
         def _parse_nums(data_atom: bytes) -> dict[str, int]:
-            number_data = data_atom[8:14]
-            numbers = unpack('>3H', number_data)
+            numbers = cls._UINT16_X3.unpack_from(data_atom, 8)
             # for some reason the first number is always irrelevant.
             return {fieldname1: numbers[1], fieldname2: numbers[2]}
         return _parse_nums
@@ -624,25 +787,29 @@ class _MP4(TinyTag):
     @classmethod
     def _parse_id3v1_genre(cls, data_atom: bytes) -> dict[str, str]:
         # dunno why genre is offset by -1 but that's how mutagen does it
-        idx = unpack('>H', data_atom[8:])[0] - 1
+        idx = cls._UINT16.unpack_from(data_atom, 8)[0] - 1
         result = {}
-        # pylint: disable=protected-access
-        if idx < len(_ID3._ID3V1_GENRES):
+        try:
+            # pylint: disable=protected-access
             result['genre'] = _ID3._ID3V1_GENRES[idx]
+        except IndexError:
+            pass
         return result
 
     @classmethod
     def _parse_cover_image(cls, data_atom: bytes) -> dict[str, Image]:
-        data_type = unpack('>I', data_atom[:4])[0]
+        data_type = cls._UINT32.unpack_from(data_atom)[0]
         image = Image(
             'front_cover', data_atom[8:], cls._IMAGE_MIME_TYPES.get(data_type))
         return {'images.front_cover': image}
 
     @classmethod
-    def _read_extended_descriptor(cls, esds_atom: BinaryIO) -> None:
+    def _skip_extended_descriptor(cls, esds_atom: bytes, pos: int) -> int:
         for _i in range(4):
-            if esds_atom.read(1) != b'\x80':
+            pos += 1
+            if esds_atom[pos - 1:pos] != b'\x80':
                 break
+        return pos
 
     @classmethod
     def _parse_custom_field(
@@ -654,7 +821,7 @@ class _MP4(TinyTag):
         data_atom = b''
         atom_header = fh.read(header_len)
         while len(atom_header) == header_len:
-            atom_size = unpack('>I', atom_header[:4])[0] - header_len
+            atom_size = cls._UINT32.unpack_from(atom_header)[0] - header_len
             atom_type = atom_header[4:]
             if atom_type == b'name':
                 atom_value = fh.read(atom_size)[4:].lower()
@@ -680,23 +847,23 @@ class _MP4(TinyTag):
         # http://sasperger.tistory.com/103
 
         # jump over version and flags
-        channels = unpack('>H', data[16:18])[0]
+        channels = cls._UINT16.unpack_from(data, 16)[0]
         # jump over bit_depth, QT compr id & pkt size
-        sr = unpack('>I', data[22:26])[0]
+        sr = cls._UINT32.unpack_from(data, 22)[0]
 
         # ES Description Atom
-        esds_atom_size = unpack('>I', data[28:32])[0]
-        esds_atom = BytesIO(data[36:36 + esds_atom_size])
-        esds_atom.seek(5, SEEK_CUR)   # jump over version, flags and tag
+        esds_atom_size = cls._UINT32.unpack_from(data, 28)[0]
+        esds_atom = data[36:36 + esds_atom_size]
+        pos = 5  # jump over version, flags and tag
 
         # ES Descriptor
-        cls._read_extended_descriptor(esds_atom)
-        esds_atom.seek(4, SEEK_CUR)   # jump over ES id, flags and tag
+        pos = cls._skip_extended_descriptor(esds_atom, pos)
+        pos += 4  # jump over ES id, flags and tag
 
         # Decoder Config Descriptor
-        cls._read_extended_descriptor(esds_atom)
-        esds_atom.seek(9, SEEK_CUR)
-        avg_br = unpack('>I', esds_atom.read(4))[0] / 1000  # kbit/s
+        pos = cls._skip_extended_descriptor(esds_atom, pos)
+        pos += 9
+        avg_br = cls._UINT32.unpack_from(esds_atom, pos)[0] / 1000  # kbit/s
         return {'channels': channels, 'samplerate': sr, 'bitrate': avg_br}
 
     @classmethod
@@ -704,7 +871,7 @@ class _MP4(TinyTag):
         # https://github.com/macosforge/alac/blob/master/ALACMagicCookieDescription.txt
         bitdepth = data[45]
         channels = data[49]
-        avg_br, sr = unpack('>II', data[56:64])
+        avg_br, sr = cls._UINT32_X2.unpack_from(data, 56)
         avg_br /= 1000  # kbit/s
         return {'channels': channels, 'samplerate': sr, 'bitrate': avg_br,
                 'bitdepth': bitdepth}
@@ -715,9 +882,9 @@ class _MP4(TinyTag):
         version = data[0]
         # jump over flags, create & mod times
         if version == 0:  # uses 32 bit integers for timestamps
-            time_scale, duration = unpack('>II', data[12:20])
+            time_scale, duration = cls._UINT32_X2.unpack_from(data, 12)
         else:  # version == 1:  # uses 64-bit integers for timestamps
-            time_scale, duration = unpack('>IQ', data[20:32])
+            time_scale, duration = cls._UINT32_UINT64.unpack_from(data, 20)
         return {'duration': duration / time_scale}
 
 
@@ -727,31 +894,31 @@ class _ID3(TinyTag):
     _ID3_MAPPING = {
         # Mapping from Frame ID to a field of the TinyTag
         # https://exiftool.org/TagNames/ID3.html
-        'COMM': 'comment', 'COM': 'comment',
-        'TRCK': 'track', 'TRK': 'track',
-        'TYER': 'year', 'TYE': 'year', 'TDRC': 'year',
-        'TALB': 'album', 'TAL': 'album',
-        'TPE1': 'artist', 'TP1': 'artist',
-        'TIT2': 'title', 'TT2': 'title',
-        'TCON': 'genre', 'TCO': 'genre',
-        'TPOS': 'disc', 'TPA': 'disc',
-        'TPE2': 'albumartist', 'TP2': 'albumartist',
-        'TCOM': 'composer', 'TCM': 'composer',
-        'WOAR': 'other.url', 'WAR': 'other.url',
-        'TSRC': 'other.isrc', 'TRC': 'other.isrc',
-        'TCOP': 'other.copyright', 'TCR': 'other.copyright',
-        'TBPM': 'other.bpm', 'TBP': 'other.bpm',
-        'TKEY': 'other.initial_key', 'TKE': 'other.initial_key',
-        'TLAN': 'other.language', 'TLA': 'other.language',
-        'TPUB': 'other.publisher', 'TPB': 'other.publisher',
-        'USLT': 'other.lyrics', 'ULT': 'other.lyrics',
-        'TPE3': 'other.conductor', 'TP3': 'other.conductor',
-        'TEXT': 'other.lyricist', 'TXT': 'other.lyricist',
-        'TSST': 'other.set_subtitle',
-        'TENC': 'other.encoded_by', 'TEN': 'other.encoded_by',
-        'TSSE': 'other.encoder_settings', 'TSS': 'other.encoder_settings',
-        'TMED': 'other.media', 'TMT': 'other.media',
-        'WCOP': 'other.license',
+        b'COMM': 'comment', b'COM': 'comment',
+        b'TRCK': 'track', b'TRK': 'track',
+        b'TYER': 'year', b'TYE': 'year', b'TDRC': 'year',
+        b'TALB': 'album', b'TAL': 'album',
+        b'TPE1': 'artist', b'TP1': 'artist',
+        b'TIT2': 'title', b'TT2': 'title',
+        b'TCON': 'genre', b'TCO': 'genre',
+        b'TPOS': 'disc', b'TPA': 'disc',
+        b'TPE2': 'albumartist', b'TP2': 'albumartist',
+        b'TCOM': 'composer', b'TCM': 'composer',
+        b'WOAR': 'other.url', b'WAR': 'other.url',
+        b'TSRC': 'other.isrc', b'TRC': 'other.isrc',
+        b'TCOP': 'other.copyright', b'TCR': 'other.copyright',
+        b'TBPM': 'other.bpm', b'TBP': 'other.bpm',
+        b'TKEY': 'other.initial_key', b'TKE': 'other.initial_key',
+        b'TLAN': 'other.language', b'TLA': 'other.language',
+        b'TPUB': 'other.publisher', b'TPB': 'other.publisher',
+        b'USLT': 'other.lyrics', b'ULT': 'other.lyrics',
+        b'TPE3': 'other.conductor', b'TP3': 'other.conductor',
+        b'TEXT': 'other.lyricist', b'TXT': 'other.lyricist',
+        b'TSST': 'other.set_subtitle',
+        b'TENC': 'other.encoded_by', b'TEN': 'other.encoded_by',
+        b'TSSE': 'other.encoder_settings', b'TSS': 'other.encoder_settings',
+        b'TMED': 'other.media', b'TMT': 'other.media',
+        b'WCOP': 'other.license',
     }
     _ID3_MAPPING_CUSTOM = {
         'artists': 'artist',
@@ -760,26 +927,31 @@ class _ID3(TinyTag):
         'barcode': 'other.barcode',
         'catalognumber': 'other.catalog_number',
     }
-    _IMAGE_FRAME_IDS = {'APIC', 'PIC'}
-    _CUSTOM_FRAME_IDS = {'TXXX', 'TXX'}
+    _IMAGE_FRAME_IDS = {b'APIC', b'PIC'}
+    _CUSTOM_FRAME_IDS = {b'TXXX', b'TXX'}
     _IGNORED_FRAME_IDS = {
-        'AENC', 'CRA',
-        'ATXT',
-        'CHAP',
-        'COMR',
-        'CRM',
-        'CTOC',
-        'ENCR',
-        'GEOB', 'GEO',
-        'GRID',
-        'MCDI', 'MCI',
-        'PRIV',
-        'RGAD',
-        'STC', 'SYTC'
+        b'AENC', b'CRA',
+        b'ATXT',
+        b'CHAP',
+        b'COMR',
+        b'CRM',
+        b'CTOC',
+        b'ENCR',
+        b'GEOB', b'GEO',
+        b'GRID',
+        b'MCDI', b'MCI',
+        b'PRIV',
+        b'RGAD',
+        b'STC', b'SYTC'
     }
     _ID3V1_TAG_SIZE = 128
+    _MAX_CACHED_STRING_SIZE = 256
+    _UTF16_BOMS = (b'\xfe\xff', b'\xff\xfe')
+    # title, artist, album, year, comment and genre after the 'TAG' marker
+    _ID3V1_FIELDS = Struct('30s30s30s4s30sB')
     _MAX_ESTIMATION_SEC = 30.0
     _CBR_DETECTION_FRAME_COUNT = 5
+    _VBR_HEADER_SEARCH_SIZE = 8192
     _USE_XING_HEADER = True  # much faster, but can be deactivated for testing
 
     _ID3V1_GENRES = (
@@ -881,6 +1053,12 @@ class _ID3(TinyTag):
         (_NONE, _V1L3, _V1L2, _V1L1),  # MPEG Version 1
     )
     _SAMPLES_PER_FRAME = 1152  # the default frame size for mp3
+    # eleven 1s sync bits, followed by a valid (not reserved) mpeg version
+    # and layer id, and a valid bitrate and sample rate id
+    _SYNC_PATTERN = re_compile(
+        rb'\xff[\xe2-\xe7\xf2-\xf7\xfa-\xff]'
+        rb'[\x10-\x1b\x20-\x2b\x30-\x3b\x40-\x4b\x50-\x5b\x60-\x6b\x70-\x7b'
+        rb'\x80-\x8b\x90-\x9b\xa0-\xab\xb0-\xbb\xc0-\xcb\xd0-\xdb\xe0-\xeb]')
     _CHANNELS_PER_CHANNEL_MODE = (
         2,  # 00 Stereo
         2,  # 01 Joint stereo (Stereo)
@@ -888,27 +1066,86 @@ class _ID3(TinyTag):
         1,  # 11 Single channel (Mono)
     )
 
+    _INT32 = Struct('>i')
+    _UINT32 = Struct('>I')
+    _UINT32_X2 = Struct('>II')
+    _frame_table: tuple[tuple[int, int, int, int] | None, ...] | None = None
+
     def __init__(self) -> None:
         super().__init__()
         # save position after the ID3 tag for duration measurement speedup
         self._bytepos_after_id3v2 = -1
 
-    @staticmethod
-    def _parse_xing_header(fh: BinaryIO) -> tuple[int, int]:
+    @classmethod
+    def _get_frame_table(cls) -> tuple[tuple[int, int, int, int] | None, ...]:
+        # (mpeg id, bitrate, sample rate, frame length without padding) for
+        # each combination of the 11 bits of mpeg, layer, protection, bitrate
+        # and sample rate ids in a frame header, None if invalid
+        if cls._frame_table is None:
+            frame_table: list[tuple[int, int, int, int] | None] = []
+            for key in range(2048):
+                mpeg_id = key >> 9
+                layer_id = (key >> 7) & 0x03
+                br_id = (key >> 2) & 0x0F
+                sr_id = key & 0x03
+                if (br_id > 14 or br_id == 0 or sr_id == 3 or layer_id == 0
+                        or mpeg_id == 1):
+                    frame_table.append(None)
+                    continue
+                bitrate = cls._BITRATE_VERSION_LAYERS[mpeg_id][layer_id][br_id]
+                samplerate = cls._SAMPLE_RATES[mpeg_id][sr_id]
+                frame_table.append((mpeg_id, bitrate, samplerate,
+                                    (144000 * bitrate) // samplerate))
+            cls._frame_table = tuple(frame_table)
+        return cls._frame_table
+
+    @classmethod
+    def _parse_xing_header(cls, data: bytes | _MappedFile,
+                           pos: int) -> tuple[int, int]:
         # see: http://www.mp3-tech.org/programmer/sources/vbrheadersdk.zip
-        fh.seek(4, SEEK_CUR)  # read over Xing header
-        header_flags = unpack('>i', fh.read(4))[0]
+        unpack_int32 = cls._INT32.unpack_from
+        pos += 4  # read over Xing header
+        header_flags = unpack_int32(data, pos)[0]
+        pos += 4
         frames = byte_count = 0
         if header_flags & 1:  # FRAMES FLAG
-            frames = unpack('>i', fh.read(4))[0]
+            frames = unpack_int32(data, pos)[0]
+            pos += 4
         if header_flags & 2:  # BYTES FLAG
-            byte_count = unpack('>i', fh.read(4))[0]
-        if header_flags & 4:  # TOC FLAG
-            fh.seek(100, SEEK_CUR)
-        if header_flags & 8:  # VBR SCALE FLAG
-            fh.seek(4, SEEK_CUR)
+            byte_count = unpack_int32(data, pos)[0]
+        # TOC and VBR scale fields are not needed
+        return frames, byte_count
+
+    @classmethod
+    def _parse_vbri_header(cls, data: bytes | _MappedFile,
+                           pos: int) -> tuple[int, int]:
+        # Fraunhofer VBR header, 32 bytes after the first frame header
+        # https://www.codeproject.com/Articles/8295/MPEG-Audio-Frame-Header
+        byte_count, frames = cls._UINT32_X2.unpack_from(data, pos + 10)
         return frames, byte_count
 
+    def _parse_vbr_header(self, data: bytes | _MappedFile, pos: int,
+                          frame_length: int, mpeg_id: int,
+                          samplerate: int) -> bool:
+        # a Xing or VBRI header in the first frame contains the frame and
+        # byte count of the stream, which gives us the exact duration
+        xframes = byte_count = 0
+        xing_header_pos = data.find(b'Xing', pos, pos + frame_length)
+        if xing_header_pos != -1:
+            xframes, byte_count = self._parse_xing_header(
+                data, xing_header_pos)
+        elif data[pos + 36:pos + 40] == b'VBRI':
+            xframes, byte_count = self._parse_vbri_header(data, pos + 36)
+        if xframes <= 0 or byte_count <= 0:
+            return False
+        # MPEG-2 Audio Layer III uses 576 samples per frame
+        samples_pf = self._SAMPLES_PER_FRAME
+        if mpeg_id <= 2:
+            samples_pf = 576
+        self.duration = dur = xframes * samples_pf / samplerate
+        self.bitrate = byte_count * 8 / dur / 1000
+        return True
+
     def _determine_duration(self, fh: BinaryIO) -> None:
         # if tag reading was disabled, find start position of audio data
         if self._bytepos_after_id3v2 == -1:
@@ -920,77 +1157,82 @@ class _ID3(TinyTag):
         audio_offset = 0
         frames = 0  # count frames for determining mp3 duration
         bitrate_accu = 0    # add up bitrates to find average bitrate to detect
-        last_bitrates = set()  # CBR mp3s (multiple frames with same bitrates)
+        first_frame_br = 0  # CBR mp3s (multiple frames with same bitrates)
+        same_bitrates = True
         # seek to first position after id3 tag (speedup for large header)
         first_mpeg_id = None
         fh.seek(self._bytepos_after_id3v2)
-        file_offset = fh.tell()
-        walker = BytesIO(fh.read())
+        data: bytes | _MappedFile
+        if isinstance(fh, _MappedFile):
+            # scan the mapped file directly instead of copying the audio
+            data, data_offset, pos = fh, 0, fh.tell()
+            fully_read = True
+        else:
+            # most files have a VBR header in the first frame, only read the
+            # rest of the file if frames need to be counted
+            data_offset, pos = fh.tell(), 0
+            data = fh.read(self._VBR_HEADER_SEARCH_SIZE)
+            fully_read = len(data) < self._VBR_HEADER_SEARCH_SIZE
+        data_len = len(data)
+        search_sync = self._SYNC_PATTERN.search
+        frame_table = self._get_frame_table()
+        unpack_header = self._UINT32.unpack_from
+        channels_per_channel_mode = self._CHANNELS_PER_CHANNEL_MODE
+        cbr_detection_frame_count = self._CBR_DETECTION_FRAME_COUNT
         while True:
             # reading through garbage until 11 '1' sync-bits are found
-            header = walker.read(4)
-            header_len = len(header)
-            walker.seek(-header_len, SEEK_CUR)
-            if header_len < 4:
+            match = search_sync(data, pos)
+            if match is None or match.start() + 4 > data_len:
+                if not fully_read:
+                    data = b''.join((data, fh.read()))
+                    data_len = len(data)
+                    fully_read = True
+                    continue
                 if frames:
                     self.bitrate = bitrate_accu / frames
                 break  # EOF
-            _sync, conf, bitrate_freq, rest = unpack('4B', header)
-            br_id = (bitrate_freq >> 4) & 0x0F  # biterate id
-            sr_id = (bitrate_freq >> 2) & 0x03  # sample rate id
-            padding = 1 if bitrate_freq & 0x02 > 0 else 0
-            mpeg_id = (conf >> 3) & 0x03
-            layer_id = (conf >> 1) & 0x03
-            channel_mode = (rest >> 6) & 0x03
-            # check for eleven 1s, validate bitrate and sample rate
-            if (header[:2] <= b'\xFF\xE0'
-                    or (first_mpeg_id is not None and first_mpeg_id != mpeg_id)
-                    or br_id > 14 or br_id == 0 or sr_id == 3 or layer_id == 0
-                    or mpeg_id == 1):
+            pos = match.start()
+            header = unpack_header(data, pos)[0]
+            # version, layer, protection, bitrate and sample rate bits
+            frame_info = frame_table[(header >> 10) & 0x7FF]
+            if frame_info is None or (first_mpeg_id is not None
+                                      and first_mpeg_id != frame_info[0]):
                 # invalid frame, find next sync header
-                idx = header.find(b'\xFF', 1)
-                if idx == -1:
-                    # not found: jump over the current peek buffer
-                    idx = header_len
-                walker.seek(max(idx, 1), SEEK_CUR)
+                pos += 1
                 continue
+            mpeg_id, frame_br, samplerate, frame_length = frame_info
+            if header & 0x200:
+                frame_length += 1  # padding
             if first_mpeg_id is None:
                 first_mpeg_id = mpeg_id
-            self.channels = self._CHANNELS_PER_CHANNEL_MODE[channel_mode]
-            frame_br = self._BITRATE_VERSION_LAYERS[mpeg_id][layer_id][br_id]
-            self.samplerate = samplerate = self._SAMPLE_RATES[mpeg_id][sr_id]
-            frame_length = (144000 * frame_br) // samplerate + padding
+            self.channels = channels_per_channel_mode[(header >> 6) & 0x03]
+            self.samplerate = samplerate
             # There might be a xing header in the first frame that contains
             # all the info we need, otherwise parse multiple frames to find the
             # accurate average bitrate
             if frames == 0 and self._USE_XING_HEADER:
-                walker_offset = walker.tell()
-                frame_content = walker.read(frame_length)
-                xing_header_offset = frame_content.find(b'Xing')
-                if xing_header_offset != -1:
-                    walker.seek(walker_offset + xing_header_offset)
-                    xframes, byte_count = self._parse_xing_header(walker)
-                    if xframes > 0 and byte_count > 0:
-                        # MPEG-2 Audio Layer III uses 576 samples per frame
-                        samples_pf = self._SAMPLES_PER_FRAME
-                        if mpeg_id <= 2:
-                            samples_pf = 576
-                        self.duration = dur = xframes * samples_pf / samplerate
-                        self.bitrate = byte_count * 8 / dur / 1000
-                        return
-                walker.seek(walker_offset)
+                # Xing fields may end 16 bytes after the frame data, VBRI
+                # fields 54 bytes after the frame start
+                if not fully_read and (
+                        pos + max(frame_length + 16, 54) > data_len):
+                    data = b''.join((data, fh.read()))
+                    data_len = len(data)
+                    fully_read = True
+                if self._parse_vbr_header(
+                        data, pos, frame_length, mpeg_id, samplerate):
+                    return
 
             frames += 1  # it's most probably a mp3 frame
             bitrate_accu += frame_br
             if frames == 1:
-                audio_offset = file_offset + walker.tell()
-            if frames <= self._CBR_DETECTION_FRAME_COUNT:
-                last_bitrates.add(frame_br)
+                audio_offset = data_offset + pos
+                first_frame_br = frame_br
+            elif frame_br != first_frame_br:
+                same_bitrates = False
 
             frame_size_accu += frame_length
             # if bitrate does not change over time its probably CBR
-            is_cbr = (frames == self._CBR_DETECTION_FRAME_COUNT
-                      and len(last_bitrates) == 1)
+            is_cbr = frames == cbr_detection_frame_count and same_bitrates
             if frames == max_estimation_frames or is_cbr:
                 # try to estimate duration
                 stream_size = (
@@ -1002,7 +1244,7 @@ class _ID3(TinyTag):
                 return
 
             if frame_length > 1:  # jump over current frame body
-                walker.seek(frame_length, SEEK_CUR)
+                pos += frame_length
         if self.samplerate:
             self.duration = frames * self._SAMPLES_PER_FRAME / self.samplerate
 
@@ -1024,7 +1266,7 @@ class _ID3(TinyTag):
             if _DEBUG:
                 print(f'Found id3 v2.{major}')
             extended = (header[5] & 0x40) > 0
-            size = self._unsynchsafe(unpack('4B', header[6:10]))
+            size = self._unsynchsafe(header, 6)
         self._bytepos_after_id3v2 = size
         return size, extended, major
 
@@ -1032,20 +1274,24 @@ class _ID3(TinyTag):
         size, extended, major = self._parse_id3v2_header(fh)
         if size <= 0:
             return
-        end_pos = fh.tell() + size
+        if not self._parse_tags and not self._load_image:
+            fh.seek(size, SEEK_CUR)  # nothing to parse, skip the tag
+            return
+        data = fh.read(size)
+        pos = 0
         parsed_size = 0
         if extended:  # just read over the extended header.
-            extd_size = self._unsynchsafe(unpack('4B', fh.read(6)[:4]))
-            fh.seek(extd_size - 6, SEEK_CUR)  # jump over extended_header
+            pos = self._unsynchsafe(data)
         while parsed_size < size:
-            frame_size = self._parse_frame(fh, size, id3version=major)
+            frame_size, pos = self._parse_frame(
+                data, pos, size, id3version=major)
             if frame_size == 0:
                 break
             parsed_size += frame_size
-        fh.seek(end_pos)
 
     def _parse_id3v1(self, fh: BinaryIO) -> None:
-        if fh.read(3) != b'TAG':  # check if this is an ID3 v1 tag
+        data = fh.read(self._ID3V1_TAG_SIZE)
+        if data[:3] != b'TAG':  # check if this is an ID3 v1 tag
             return
 
         def asciidecode(x: bytes) -> str:
@@ -1053,36 +1299,37 @@ class _ID3(TinyTag):
                 x.decode(self._default_encoding or 'latin1', 'replace'))
         # Only set fields that were not set by ID3v2 tags, as ID3v1
         # tags are more likely to be outdated or have encoding issues
-        fields = fh.read(30 + 30 + 30 + 4 + 30 + 1)
+        title, artist, album, year, comment, genre_id = (
+            self._ID3V1_FIELDS.unpack_from(data, 3))
         if not self.title:
-            value = asciidecode(fields[:30])
+            value = asciidecode(title)
             if value:
                 self._set_field('title', value)
         if not self.artist:
-            value = asciidecode(fields[30:60])
+            value = asciidecode(artist)
             if value:
                 self._set_field('artist', value)
         if not self.album:
-            value = asciidecode(fields[60:90])
+            value = asciidecode(album)
             if value:
                 self._set_field('album', value)
         if not self.year:
-            value = asciidecode(fields[90:94])
+            value = asciidecode(year)
             if value:
                 self._set_field('year', value)
-        comment = fields[94:124]
-        if b'\x00\x00' < comment[-2:] < b'\x01\x00':
+        if not comment[28] and comment[29]:  # ID3v1.1 track number
             if self.track is None:
-                self._set_field('track', ord(comment[-1:]))
-            comment = comment[:-2]
+                self._set_field('track', comment[29])
+            comment = comment[:28]
         if not self.comment:
             value = asciidecode(comment)
             if value:
                 self._set_field('comment', value)
         if not self.genre:
-            genre_id = ord(fields[124:125])
-            if genre_id < len(self._ID3V1_GENRES):
+            try:
                 self._set_field('genre', self._ID3V1_GENRES[genre_id])
+            except IndexError:
+                pass  # unknown genre id
 
     def __parse_custom_field(self, content: str) -> bool:
         custom_field_name, separator, value = content.partition('\x00')
@@ -1116,40 +1363,50 @@ class _ID3(TinyTag):
         return field_name, image
 
     def _parse_frame(self,
-                     fh: BinaryIO,
+                     data: bytes,
+                     pos: int,
                      total_size: int,
-                     id3version: int | None = None) -> int:
+                     id3version: int | None = None) -> tuple[int, int]:
+        # returns the frame content size and the position of the next frame
         # ID3v2.2 especially ugly. see: http://id3.org/id3v2-00
         header_len = 6 if id3version == 2 else 10
         frame_size_bytes = 3 if id3version == 2 else 4
         is_synchsafe_int = id3version == 4
-        header = fh.read(header_len)
-        if len(header) != header_len:
-            return 0
-        frame_id = self._decode_string(header[:frame_size_bytes])
+        if len(data) - pos < header_len:
+            return 0, pos
+        frame_id = data[pos:pos + frame_size_bytes].strip(b'\x00')
         frame_size: int
         if frame_size_bytes == 3:
-            frame_size = unpack('>I', b'\x00' + header[3:6])[0]
+            frame_size = int.from_bytes(data[pos + 3:pos + 6], 'big')
         elif is_synchsafe_int:
-            frame_size = self._unsynchsafe(unpack('4B', header[4:8]))
+            frame_size = self._unsynchsafe(data, pos + 4)
         else:
-            frame_size = unpack('>I', header[4:8])[0]
+            frame_size = self._UINT32.unpack_from(data, pos + 4)[0]
+        pos += header_len
         if _DEBUG:
-            print(f'Found id3 Frame {frame_id} at '
-                  f'{fh.tell()}-{fh.tell() + frame_size} of {self.filesize}')
+            print(f'Found id3 Frame {frame_id!r} at '
+                  f'{pos}-{pos + frame_size} of {total_size}')
         if frame_size > total_size:
             # invalid frame size, stop here
-            return 0
-        content = fh.read(frame_size)
+            return 0, pos
+        # skip frames we don't need without copying their content
+        if frame_id in self._IMAGE_FRAME_IDS:
+            should_parse_frame = self._load_image
+        elif frame_id in self._IGNORED_FRAME_IDS:
+            should_parse_frame = False
+        else:
+            should_parse_frame = self._parse_tags
+        if not should_parse_frame:
+            return frame_size, pos + frame_size
+        content = data[pos:pos + frame_size]
+        pos += frame_size
         fieldname = self._ID3_MAPPING.get(frame_id)
         should_set_field = True
         if fieldname:
-            if not self._parse_tags:
-                return frame_size
             language = fieldname in {'comment', 'other.lyrics'}
             value = self._decode_string(content, language)
             if not value:
-                return frame_size
+                return frame_size, pos
             if fieldname == "comment":
                 # check if comment is a key-value pair (used by iTunes)
                 should_set_field = not self.__parse_custom_field(value)
@@ -1172,60 +1429,66 @@ class _ID3(TinyTag):
                     parens_text = value[1:end_pos]
                     if end_pos > 0 and parens_text.isdecimal():
                         genre_id = int(parens_text)
-                if 0 <= genre_id < len(self._ID3V1_GENRES):
+                try:
                     value = self._ID3V1_GENRES[genre_id]
+                except IndexError:
+                    pass  # not a genre id, keep value
             if should_set_field:
                 self._set_field(fieldname, value)
         elif frame_id in self._CUSTOM_FRAME_IDS:
             # custom fields
-            if self._parse_tags:
-                value = self._decode_string(content)
-                if value:
-                    self.__parse_custom_field(value)
+            value = self._decode_string(content)
+            if value:
+                self.__parse_custom_field(value)
         elif frame_id in self._IMAGE_FRAME_IDS:
-            if self._load_image:
-                # See section 4.14: http://id3.org/id3v2.4.0-frames
-                encoding = content[:1]
-                if frame_id == 'PIC':  # ID3 v2.2:
-                    imgformat = self._decode_string(content[1:4]).lower()
-                    mime_type = self._ID3V2_2_IMAGE_FORMATS.get(imgformat)
-                    # skip encoding (1), imgformat (3), pictype(1)
-                    desc_start_pos = 5
-                else:  # ID3 v2.3+
-                    mime_end_pos = content.index(b'\x00', 1)
-                    mime_type = self._decode_string(
-                        content[1:mime_end_pos]).lower()
-                    # skip mtype, pictype(1)
-                    desc_start_pos = mime_end_pos + 2
-                pic_type = content[desc_start_pos - 1]
-                # latin1 and utf-8 are 1 byte
-                if encoding in {b'\x00', b'\x03'}:
-                    desc_end_pos = content.find(b'\x00', desc_start_pos) + 1
-                else:
-                    desc_end_pos = 0
-                    for i in range(desc_start_pos, len(content), 2):
-                        if content[i:i + 2] == b'\x00\x00':
-                            desc_end_pos = i + 2
-                            break
-                desc = self._decode_string(
-                    encoding + content[desc_start_pos:desc_end_pos])
-                field_name, image = self._create_tag_image(
-                    content[desc_end_pos:], pic_type, mime_type, desc)
-                # pylint: disable=protected-access
-                self.images._set_field(field_name, image)
-        elif frame_id not in self._IGNORED_FRAME_IDS:
+            # See section 4.14: http://id3.org/id3v2.4.0-frames
+            encoding = content[:1]
+            if frame_id == b'PIC':  # ID3 v2.2:
+                imgformat = self._decode_string(content[1:4]).lower()
+                mime_type = self._ID3V2_2_IMAGE_FORMATS.get(imgformat)
+                # skip encoding (1), imgformat (3), pictype(1)
+                desc_start_pos = 5
+            else:  # ID3 v2.3+
+                mime_end_pos = content.index(b'\x00', 1)
+                mime_type = self._decode_string(
+                    content[1:mime_end_pos]).lower()
+                # skip mtype, pictype(1)
+                desc_start_pos = mime_end_pos + 2
+            pic_type = content[desc_start_pos - 1]
+            # latin1 and utf-8 are 1 byte
+            if encoding in {b'\x00', b'\x03'}:
+                desc_end_pos = content.find(b'\x00', desc_start_pos) + 1
+            else:
+                null_pos = self._index_utf16(
+                    content, b'\x00\x00', desc_start_pos)
+                desc_end_pos = null_pos + 2 if null_pos != -1 else 0
+            desc = self._decode_string(
+                encoding + content[desc_start_pos:desc_end_pos])
+            field_name, image = self._create_tag_image(
+                content[desc_end_pos:], pic_type, mime_type, desc)
+            # pylint: disable=protected-access
+            self.images._set_field(field_name, image)
+        else:
             # unknown, try to add to other dict
-            if self._parse_tags:
-                value = self._decode_string(content)
-                if value:
-                    self._set_field(
-                        self._OTHER_PREFIX + frame_id.lower(), value)
-        return frame_size
+            value = self._decode_string(content)
+            if value:
+                field_name = self._decode_string(frame_id).lower()
+                self._set_field(self._OTHER_PREFIX + field_name, value)
+        return frame_size, pos
 
     def _decode_string(self, value: bytes, language: bool = False) -> str:
-        default_encoding = 'ISO-8859-1'
-        if self._default_encoding:
-            default_encoding = self._default_encoding
+        default_encoding = self._default_encoding or 'ISO-8859-1'
+        if len(value) > self._MAX_CACHED_STRING_SIZE:
+            return self._decode_bytes.__wrapped__(
+                self.__class__, value, language, default_encoding)
+        return self._decode_bytes(value, language, default_encoding)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _decode_bytes(cls, value: bytes, language: bool,
+                      default_encoding: str) -> str:
+        # values such as artist and album repeat across files, keep the
+        # decoded results of short strings around
         # it's not my fault, this is the spec.
         first_byte = value[:1]
         if first_byte == b'\x00':  # ISO-8859-1
@@ -1235,7 +1498,7 @@ class _ID3(TinyTag):
             value = value[1:]
             # remove language (but leave BOM)
             if language:
-                if value[3:5] in {b'\xfe\xff', b'\xff\xfe'}:
+                if value.startswith(cls._UTF16_BOMS, 3):
                     value = value[3:]
                 if value[:3].isalpha():
                     value = value[3:]  # remove language
@@ -1245,7 +1508,7 @@ class _ID3(TinyTag):
             encoding = ('UTF-16be' if value.startswith(b'\xfe\xff')
                         else 'UTF-16le')
             # strip the bom if it exists
-            if value.startswith(b'\xfe\xff') or value.startswith(b'\xff\xfe'):
+            if value.startswith(cls._UTF16_BOMS):
                 value = value[2:] if len(value) % 2 == 0 else value[2:-1]
             # remove ADDITIONAL OTHER BOM :facepalm:
             if value.startswith(b'\x00\x00\xff\xfe'):
@@ -1261,11 +1524,20 @@ class _ID3(TinyTag):
             encoding = default_encoding  # wild guess
         if language and value[:3].isalpha():
             value = value[3:]  # remove language
-        return self._unpad(value.decode(encoding, 'replace'))
+        return cls._unpad(value.decode(encoding, 'replace'))
+
+    @staticmethod
+    def _index_utf16(data: bytes, search: bytes, start: int) -> int:
+        # find search bytes at an even offset from start, -1 if not found
+        pos = data.find(search, start)
+        while pos != -1 and (pos - start) % 2:
+            pos = data.find(search, pos + 1)
+        return pos
 
     @staticmethod
-    def _unsynchsafe(ints: tuple[int, ...]) -> int:
-        return (ints[0] << 21) + (ints[1] << 14) + (ints[2] << 7) + ints[3]
+    def _unsynchsafe(data: bytes, pos: int = 0) -> int:
+        return ((data[pos] << 21) + (data[pos + 1] << 14)
+                + (data[pos + 2] << 7) + data[pos + 3])
 
 
 class _Ogg(TinyTag):
@@ -1311,6 +1583,7 @@ class _Ogg(TinyTag):
         'barcode': 'other.barcode',
         'catalognumber': 'other.catalog_number',
     }
+    _UINT32_LE = Struct('<I')
 
     def __init__(self) -> None:
         super().__init__()
@@ -1341,9 +1614,8 @@ class _Ogg(TinyTag):
                     self.bitrate = unpack("<i", packet[20:24])[0] / 1000
             elif packet.startswith(b"\x03vorbis"):
                 if self._parse_tags:
-                    walker = BytesIO(packet)
-                    walker.seek(7)  # jump over header name
-                    self._parse_vorbis_comment(walker)
+                    # jump over header name
+                    self._parse_vorbis_comment(packet, 7)
             elif packet.startswith(b'OpusHead'):
                 if self._parse_duration:  # parse opus header
                     # https://www.videolan.org/developers/vlc/modules/codec/opus_header.c
@@ -1355,9 +1627,8 @@ class _Ogg(TinyTag):
                         self._pre_skip = pre_skip
             elif packet.startswith(b'OpusTags'):
                 if self._parse_tags:  # parse opus metadata:
-                    walker = BytesIO(packet)
-                    walker.seek(8)  # jump over header name
-                    self._parse_vorbis_comment(walker)
+                    # jump over header name
+                    self._parse_vorbis_comment(packet, 8)
                 self._audio_size = 0  # start counting size of audio stream
             elif packet.startswith(b'\x7fFLAC'):
                 # https://xiph.org/flac/ogg_mapping.html
@@ -1376,12 +1647,11 @@ class _Ogg(TinyTag):
             elif check_flac_second_packet:
                 # second packet contains FLAC metadata block
                 if self._parse_tags:
-                    walker = BytesIO(packet)
-                    meta_header = walker.read(4)
-                    block_type = meta_header[0] & 0x7f
+                    block_type = packet[0] & 0x7f
                     # pylint: disable=protected-access
                     if block_type == _Flac._VORBIS_COMMENT:
-                        self._parse_vorbis_comment(walker)
+                        # jump over metadata block header
+                        self._parse_vorbis_comment(packet, 4)
                 check_flac_second_packet = False
             elif packet.startswith(b'Speex   '):
                 # https://speex.org/docs/manual/speex-manual/node8.html
@@ -1391,13 +1661,13 @@ class _Ogg(TinyTag):
                 check_speex_second_packet = True
             elif check_speex_second_packet:
                 if self._parse_tags:
-                    walker = BytesIO(packet)
                     # starts with a comment string
-                    length = unpack('I', walker.read(4))[0]
-                    comment = walker.read(length).decode('utf-8', 'replace')
+                    length = self._UINT32_LE.unpack_from(packet)[0]
+                    comment = packet[4:4 + length].decode('utf-8', 'replace')
                     self._set_field('comment', comment)
                     # other tags
-                    self._parse_vorbis_comment(walker, has_vendor=False)
+                    self._parse_vorbis_comment(
+                        packet, 4 + length, has_vendor=False)
                 check_speex_second_packet = False
             else:
                 # Optimization: If we need to determine the duration, read
@@ -1409,23 +1679,30 @@ class _Ogg(TinyTag):
         self._tags_parsed = True
 
     def _parse_vorbis_comment(self,
-                              fh: BinaryIO,
+                              data: bytes,
+                              pos: int = 0,
                               has_vendor: bool = True) -> None:
         # for the spec, see: http://xiph.org/vorbis/doc/v-comment.html
         # discnumber tag based on: https://en.wikipedia.org/wiki/Vorbis_comment
         # https://sno.phy.queensu.ca/~phil/exiftool/TagNames/Vorbis.html
+        unpack_uint32 = self._UINT32_LE.unpack_from
         if has_vendor:
-            vendor_length = unpack('I', fh.read(4))[0]
-            fh.seek(vendor_length, SEEK_CUR)  # jump over vendor
-        elements = unpack('I', fh.read(4))[0]
+            vendor_length = unpack_uint32(data, pos)[0]
+            pos += 4 + vendor_length  # jump over vendor
+        elements = unpack_uint32(data, pos)[0]
+        pos += 4
         for _i in range(elements):
-            length = unpack('I', fh.read(4))[0]
-            keyvalpair = fh.read(length).decode('utf-8', 'replace')
-            if '=' in keyvalpair:
-                key, value = keyvalpair.split('=', 1)
+            length = unpack_uint32(data, pos)[0]
+            pos += 4
+            keyvalpair = data[pos:pos + length].decode('utf-8', 'replace')
+            pos += length
+            key, separator, value = keyvalpair.partition('=')
+            if separator:
                 key_lower = key.lower()
                 if key_lower == "metadata_block_picture":
                     if self._load_image:
+                        # pylint: disable=import-outside-toplevel
+                        from binascii import a2b_base64
                         if _DEBUG:
                             print('Found Vorbis Image', key, value[:64])
                         # pylint: disable=protected-access
@@ -1452,12 +1729,13 @@ class _Ogg(TinyTag):
 
     def _parse_pages(self, fh: BinaryIO) -> Iterator[bytes]:
         # for the spec, see: https://wiki.xiph.org/Ogg
-        packet_data = bytearray()
+        read, seek = fh.read, fh.seek
+        packet_parts: list[bytes] = []
         current_serial = None
         last_granule_pos = 0
         last_audio_size = 0
         header_len = 27
-        page_header = fh.read(header_len)  # read ogg page header
+        page_header = read(header_len)  # read ogg page header
         while len(page_header) == header_len:
             version = page_header[4]
             if page_header[:4] != b'OggS' or version != 0:
@@ -1475,8 +1753,12 @@ class _Ogg(TinyTag):
                 else:
                     self._granule_pos = last_granule_pos
                     last_granule_pos = granule_pos
-            segments = page_header[26]
-            seg_sizes = unpack('B' * segments, fh.read(segments))
+            seg_sizes = read(page_header[26])
+            # read the whole page body at once if any packets are needed,
+            # otherwise skip over it
+            read_page = serial_match and not self._tags_parsed
+            page = read(sum(seg_sizes)) if read_page else b''
+            page_pos = 0
             read_size = 0
             audio_size = 0
             for seg_size in seg_sizes:  # read all segments
@@ -1485,22 +1767,24 @@ class _Ogg(TinyTag):
                     audio_size += seg_size
                 # less than 255 bytes means end of packet
                 if seg_size < 255 and serial_match and not self._tags_parsed:
-                    packet_data += fh.read(read_size)
-                    yield packet_data
-                    packet_data.clear()
+                    packet_parts.append(page[page_pos:page_pos + read_size])
+                    yield b''.join(packet_parts)
+                    packet_parts.clear()
+                    page_pos += read_size
                     read_size = 0
             if read_size:
                 if not serial_match or self._tags_parsed:
-                    fh.seek(read_size, SEEK_CUR)
+                    if not read_page:
+                        seek(read_size, SEEK_CUR)
                 else:  # packet continues on next page
-                    packet_data += fh.read(read_size)
+                    packet_parts.append(page[page_pos:page_pos + read_size])
             if serial_match and self._audio_size is not None:
                 if eos:
                     self._audio_size += last_audio_size + audio_size
                 else:
                     self._audio_size += last_audio_size
                     last_audio_size = audio_size
-            page_header = fh.read(header_len)
+            page_header = read(header_len)
 
 
 class _Wave(TinyTag):
@@ -1532,6 +1816,7 @@ class _Wave(TinyTag):
         b'IENC': 'other.encoded_by',
         b'IMED': 'other.media',
     }
+    _UINT32 = Struct('<I')
 
     def _determine_duration(self, fh: BinaryIO) -> None:
         if not self._tags_parsed:
@@ -1549,7 +1834,7 @@ class _Wave(TinyTag):
         chunk_header = fh.read(header_len)
         while len(chunk_header) == header_len:
             subchunk_id = chunk_header[:4]
-            subchunk_size = unpack('I', chunk_header[4:])[0]
+            subchunk_size = self._UINT32.unpack_from(chunk_header, 4)[0]
             # IFF chunks are padded to an even number of bytes
             subchunk_size += subchunk_size % 2
             if subchunk_id == b'fmt ' and self._parse_duration:
@@ -1573,24 +1858,7 @@ class _Wave(TinyTag):
             elif subchunk_id == b'LIST' and self._parse_tags:
                 chunk = fh.read(subchunk_size)
                 if chunk.startswith(b'INFO'):
-                    walker = BytesIO(chunk)
-                    walker.seek(4)  # skip header
-                    field = walker.read(4)
-                    while len(field) == 4:
-                        data_length = unpack('I', walker.read(4))[0]
-                        # IFF chunks are padded to an even size
-                        data_length += data_length % 2
-                        # strip zero-byte
-                        data = walker.read(data_length).split(b'\x00', 1)[0]
-                        fieldname = self._RIFF_MAPPING.get(field)
-                        if fieldname:
-                            value = data.decode('utf-8', 'replace')
-                            if fieldname == 'track':
-                                if value.isdecimal():
-                                    self._set_field(fieldname, int(value))
-                            else:
-                                self._set_field(fieldname, value)
-                        field = walker.read(4)
+                    self._parse_riff_info(chunk)
             elif subchunk_id in {b'id3 ', b'ID3 '} and self._parse_tags:
                 # pylint: disable=protected-access
                 id3 = _ID3()
@@ -1602,6 +1870,26 @@ class _Wave(TinyTag):
             chunk_header = fh.read(header_len)
         self._tags_parsed = True
 
+    def _parse_riff_info(self, chunk: bytes) -> None:
+        pos = 4  # skip header
+        chunk_len = len(chunk)
+        while pos + 4 <= chunk_len:
+            field = chunk[pos:pos + 4]
+            data_length = self._UINT32.unpack_from(chunk, pos + 4)[0]
+            # IFF chunks are padded to an even size
+            data_length += data_length % 2
+            pos += 8
+            # strip zero-byte
+            data = chunk[pos:pos + data_length].split(b'\x00', 1)[0]
+            pos += data_length
+            fieldname = self._RIFF_MAPPING.get(field)
+            if fieldname == 'track':
+                # int() accepts ASCII digits as bytes directly
+                if data.isdigit():
+                    self._set_field(fieldname, int(data))
+            elif fieldname:
+                self._set_field(fieldname, data.decode('utf-8', 'replace'))
+
 
 class _Flac(TinyTag):
     """FLAC Parser."""
@@ -1609,6 +1897,9 @@ class _Flac(TinyTag):
     _STREAMINFO = 0
     _VORBIS_COMMENT = 4
     _PICTURE = 6
+    _UINT32 = Struct('>I')
+    _UINT32_X2 = Struct('>II')
+    _UINT64 = Struct('>Q')
 
     def _determine_duration(self, fh: BinaryIO) -> None:
         if not self._tags_parsed:
@@ -1633,7 +1924,7 @@ class _Flac(TinyTag):
         while len(block_header) == header_len:
             block_type = block_header[0] & 0x7f
             is_last_block = block_header[0] & 0x80
-            size = unpack('>I', b'\x00' + block_header[1:])[0]
+            size = int.from_bytes(block_header[1:], 'big')
             # http://xiph.org/flac/format.html#metadata_block_streaminfo
             if block_type == self._STREAMINFO and self._parse_duration:
                 head = fh.read(size)
@@ -1655,21 +1946,19 @@ class _Flac(TinyTag):
                 # |----- samplerate -----| |-||----| |---------~   ~----|
                 # 0000 0000 0000 0000 0000 0000 0000 0000 0000      0000
                 # #---4---# #---5---# #---6---# #---7---# #--8-~   ~-12-#
-                sr = unpack('>I', b'\x00' + head[10:13])[0] >> 4
-                self.channels = ((head[12] >> 1) & 0x07) + 1
-                self.bitdepth = (
-                    ((head[12] & 1) << 4) + ((head[13] & 0xF0) >> 4) + 1)
-                tot_samples_b = bytes([head[13] & 0x0F]) + head[14:18]
-                tot_samples = unpack('>Q', b'\x00\x00\x00' + tot_samples_b)[0]
+                stream_info = self._UINT64.unpack_from(head, 10)[0]
+                sr = stream_info >> 44
+                self.channels = ((stream_info >> 41) & 0x07) + 1
+                self.bitdepth = ((stream_info >> 36) & 0x1F) + 1
+                tot_samples = stream_info & 0xFFFFFFFFF
                 self.duration = duration = tot_samples / sr
                 self.samplerate = sr
                 if duration > 0:
-                    self.bitrate = self.filesize * 8 / duration / 1000
+                    self.bitrate = self.filesize * 0.008 / duration
             elif block_type == self._VORBIS_COMMENT and self._parse_tags:
                 # pylint: disable=protected-access
-                walker = BytesIO(fh.read(size))
                 oggtag = _Ogg()
-                oggtag._parse_vorbis_comment(walker)
+                oggtag._parse_vorbis_comment(fh.read(size))
                 self._update(oggtag)
             elif block_type == self._PICTURE and self._load_image:
                 fieldname, value = self._parse_image(fh)
@@ -1687,12 +1976,17 @@ class _Flac(TinyTag):
     @classmethod
     def _parse_image(cls, fh: BinaryIO) -> tuple[str, Image]:
         # https://xiph.org/flac/format.html#metadata_block_picture
-        pic_type, mime_type_len = unpack('>II', fh.read(8))
-        mime_type = fh.read(mime_type_len).decode('utf-8', 'replace')
-        description_len = unpack('>I', fh.read(4))[0]
-        description = fh.read(description_len).decode('utf-8', 'replace')
-        fh.seek(16, SEEK_CUR)  # jump over width, height, depth, colors
-        pic_len = unpack('>I', fh.read(4))[0]
+        # read from the stream, since some encoders write a wrong block size
+        # (see 106-short-picture-block-size.flac); fetch each length field
+        # together with the preceding value
+        pic_type, mime_type_len = cls._UINT32_X2.unpack(fh.read(8))
+        data = fh.read(mime_type_len + 4)
+        mime_type = data[:mime_type_len].decode('utf-8', 'replace')
+        description_len = cls._UINT32.unpack_from(data, mime_type_len)[0]
+        # width, height, depth and colors are read along with the description
+        data = fh.read(description_len + 20)
+        description = data[:description_len].decode('utf-8', 'replace')
+        pic_len = cls._UINT32.unpack_from(data, description_len + 16)[0]
         # pylint: disable=protected-access
         return _ID3._create_tag_image(
             fh.read(pic_len), pic_type, mime_type, description)
@@ -1731,12 +2025,7 @@ class _Wma(TinyTag):
         'WM/Barcode': 'other.barcode',
         'WM/CatalogNo': 'other.catalog_number',
     }
-    _UNPACK_FORMATS = {
-        1: '<B',
-        2: '<H',
-        4: '<I',
-        8: '<Q'
-    }
+    _INT_VALUE_LENGTHS = frozenset((1, 2, 4, 8))
     _ASF_CONTENT_DESC = b'3&\xb2u\x8ef\xcf\x11\xa6\xd9\x00\xaa\x00b\xcel'
     _ASF_EXT_CONTENT_DESC = (b'@\xa4\xd0\xd2\x07\xe3\xd2\x11\x97\xf0\x00'
                              b'\xa0\xc9^\xa8P')
@@ -1746,95 +2035,130 @@ class _Wma(TinyTag):
     _ASF_STREAM_PROPS = (b'\x91\x07\xdc\xb7\xb7\xa9\xcf\x11\x8e\xe6\x00\xc0'
                          b'\x0c Se')
     _STREAM_TYPE_ASF_AUDIO_MEDIA = b'@\x9ei\xf8M[\xcf\x11\xa8\xfd\x00\x80_\\D+'
+    _UINT16 = Struct('<H')
+    _UINT16_X2 = Struct('<HH')
+    _UINT64 = Struct('<Q')
+    # title, author, copyright, description, rating
+    _CONTENT_DESC_LENGTHS = Struct('<5H')
+    _CONTENT_DESC_FIELDS = (
+        'title', 'artist', 'other.copyright', 'comment', '_rating')
+    # play duration, (send duration), preroll
+    _FILE_PROPS = Struct('<Q8xQ')
+    # codec id, channels, samplerate, avg bytes per second, (block
+    # alignment), bits per sample
+    _AUDIO_MEDIA_PROPS = Struct('<HHII2xH')
 
     def _determine_duration(self, fh: BinaryIO) -> None:
         if not self._tags_parsed:
             self._parse_tag(fh)
 
+    @classmethod
+    def _decode_string(cls, value: bytes) -> str:
+        # ASF strings are UTF-16LE without a BOM, usually NUL-terminated
+        if value[-2:] == b'\x00\x00':
+            value = value[:-2]
+        return cls._unpad(value.decode('utf-16-le', 'replace'))
+
     def _parse_tag(self, fh: BinaryIO) -> None:
         # http://www.garykessler.net/library/file_sigs.html
         # http://web.archive.org/web/20131203084402/http://msdn.microsoft.com/en-us/library/bb643323.aspx#_Toc521913958
-        header = fh.read(30)
+        read, seek = fh.read, fh.seek
+        header = read(30)
         if (header[:16] != b'0&\xb2u\x8ef\xcf\x11\xa6\xd9\x00\xaa\x00b\xcel'
                 or header[-1:] != b'\x02'):
             raise ParseError('Invalid WMA header')
+        # all objects we are interested in are part of the header object,
+        # so stop before reaching the data and index objects
+        object_count = int.from_bytes(header[24:28], 'little')
+        # map the ids of the objects needed for this call to their parsers
+        handlers: dict[bytes, Callable[[bytes], None]] = {}
+        if self._parse_tags:
+            handlers[self._ASF_CONTENT_DESC] = self._parse_content_desc
+            handlers[self._ASF_EXT_CONTENT_DESC] = (
+                self._parse_ext_content_desc)
+        if self._parse_duration:
+            handlers[self._ASF_FILE_PROP] = self._parse_file_props
+            handlers[self._ASF_STREAM_PROPS] = self._parse_stream_props
         header_len = 24
-        object_header = fh.read(header_len)
-        while len(object_header) == header_len:
-            object_size = unpack('<Q', object_header[16:])[0]
+        object_header = read(header_len)
+        while object_count and len(object_header) == header_len:
+            object_count -= 1
+            object_size = self._UINT64.unpack_from(object_header, 16)[0]
             if object_size == 0 or object_size > self.filesize:
                 break  # invalid object, stop parsing.
-            object_id = object_header[:16]
-            if object_id == self._ASF_CONTENT_DESC and self._parse_tags:
-                walker = BytesIO(fh.read(object_size - header_len))
-                (title_length, author_length,
-                 copyright_length, description_length,
-                 rating_length) = unpack('<5H', walker.read(10))
-                data_blocks = {
-                    'title': title_length,
-                    'artist': author_length,
-                    'other.copyright': copyright_length,
-                    'comment': description_length,
-                    '_rating': rating_length,
-                }
-                for i_field_name, length in data_blocks.items():
-                    value = self._unpad(
-                        walker.read(length).decode('utf-16', 'replace'))
-                    if not i_field_name.startswith('_') and value:
-                        self._set_field(i_field_name, value)
-            elif object_id == self._ASF_EXT_CONTENT_DESC and self._parse_tags:
-                # http://web.archive.org/web/20131203084402/http://msdn.microsoft.com/en-us/library/bb643323.aspx#_Toc509555195
-                walker = BytesIO(fh.read(object_size - header_len))
-                descriptor_count = unpack('<H', walker.read(2))[0]
-                for _ in range(descriptor_count):
-                    name_len = unpack('<H', walker.read(2))[0]
-                    name = self._unpad(
-                        walker.read(name_len).decode('utf-16', 'replace'))
-                    value_type, value_len = unpack('<HH', walker.read(4))
-                    # Unicode string
-                    if value_type == 0:
-                        value = self._unpad(
-                            walker.read(value_len).decode('utf-16', 'replace'))
-                    # DWORD / QWORD / WORD
-                    elif (1 < value_type < 6
-                            and value_len in self._UNPACK_FORMATS):
-                        fmt = self._UNPACK_FORMATS[value_len]
-                        value = str(unpack(fmt, walker.read(value_len))[0])
-                    else:
-                        walker.seek(value_len, SEEK_CUR)  # skip other values
-                        continue
-                    # try to get normalized field name
-                    field_name = self._ASF_MAPPING.get(name)
-                    if field_name is None:  # custom field
-                        if name.startswith('WM/'):
-                            name = name[3:]
-                        field_name = self._OTHER_PREFIX + name.lower()
-                    if field_name in {'track', 'disc'}:
-                        if isinstance(value, int) or value.isdecimal():
-                            self._set_field(field_name, int(value))
-                    elif value:
-                        self._set_field(field_name, value)
-            elif object_id == self._ASF_FILE_PROP and self._parse_duration:
-                data = fh.read(object_size - header_len)
-                play_duration = unpack('<Q', data[40:48])[0] / 10000000
-                preroll = unpack('<Q', data[56:64])[0] / 1000
-                # subtract the preroll to get the actual duration
-                self.duration = max(play_duration - preroll, 0.0)
-            elif object_id == self._ASF_STREAM_PROPS and self._parse_duration:
-                data = fh.read(object_size - header_len)
-                stream_type = data[:16]
-                if stream_type == self._STREAM_TYPE_ASF_AUDIO_MEDIA:
-                    (codec_id_format_tag, self.channels, self.samplerate,
-                     avg_bytes_per_second) = unpack('<HHII', data[54:66])
-                    self.bitrate = avg_bytes_per_second * 8 / 1000
-                    if codec_id_format_tag == 355:  # lossless
-                        self.bitdepth = unpack('<H', data[68:70])[0]
+            handler = handlers.get(object_header[:16])
+            if handler is not None:
+                handler(read(object_size - header_len))
             else:
                 # skip unknown object ids
-                fh.seek(object_size - header_len, SEEK_CUR)
-            object_header = fh.read(header_len)
+                seek(object_size - header_len, SEEK_CUR)
+            object_header = read(header_len)
         self._tags_parsed = True
 
+    def _parse_content_desc(self, data: bytes) -> None:
+        lengths = self._CONTENT_DESC_LENGTHS.unpack_from(data)
+        pos = 10
+        for i_field_name, length in zip(self._CONTENT_DESC_FIELDS, lengths):
+            end_pos = pos + length
+            if not i_field_name.startswith('_'):
+                value = self._decode_string(data[pos:end_pos])
+                if value:
+                    self._set_field(i_field_name, value)
+            pos = end_pos
+
+    def _parse_ext_content_desc(self, data: bytes) -> None:
+        # http://web.archive.org/web/20131203084402/http://msdn.microsoft.com/en-us/library/bb643323.aspx#_Toc509555195
+        uint16_unpack_from = self._UINT16.unpack_from
+        uint16_x2_unpack_from = self._UINT16_X2.unpack_from
+        descriptor_count = uint16_unpack_from(data)[0]
+        pos = 2
+        for _ in range(descriptor_count):
+            name_len = uint16_unpack_from(data, pos)[0]
+            pos += 2
+            name = self._decode_string(data[pos:pos + name_len])
+            pos += name_len
+            value_type, value_len = uint16_x2_unpack_from(data, pos)
+            pos += 4
+            end_pos = pos + value_len
+            # Unicode string
+            if value_type == 0:
+                value = self._decode_string(data[pos:end_pos])
+            # DWORD / QWORD / WORD
+            elif 1 < value_type < 6 and value_len in self._INT_VALUE_LENGTHS:
+                value = str(int.from_bytes(data[pos:end_pos], 'little'))
+            else:
+                pos = end_pos  # skip other values
+                continue
+            pos = end_pos
+            # try to get normalized field name
+            field_name = self._ASF_MAPPING.get(name)
+            if field_name is None:  # custom field
+                if name.startswith('WM/'):
+                    name = name[3:]
+                field_name = self._OTHER_PREFIX + name.lower()
+            if field_name in {'track', 'disc'}:
+                if isinstance(value, int) or value.isdecimal():
+                    self._set_field(field_name, int(value))
+            elif value:
+                self._set_field(field_name, value)
+
+    def _parse_file_props(self, data: bytes) -> None:
+        play_duration, preroll = self._FILE_PROPS.unpack_from(data, 40)
+        play_duration /= 10000000
+        preroll /= 1000
+        # subtract the preroll to get the actual duration
+        self.duration = max(play_duration - preroll, 0.0)
+
+    def _parse_stream_props(self, data: bytes) -> None:
+        stream_type = data[:16]
+        if stream_type == self._STREAM_TYPE_ASF_AUDIO_MEDIA:
+            (codec_id_format_tag, self.channels, self.samplerate,
+             avg_bytes_per_second, bitdepth) = (
+                 self._AUDIO_MEDIA_PROPS.unpack_from(data, 54))
+            self.bitrate = avg_bytes_per_second * 0.008
+            if codec_id_format_tag == 355:  # lossless
+                self.bitdepth = bitdepth
+
 
 class _Aiff(TinyTag):
     """AIFF Parser.
@@ -1864,47 +2188,64 @@ class _Aiff(TinyTag):
         b'ANNO': 'comment',
         b'(c) ': 'other.copyright',
     }
+    _UINT32 = Struct('>I')
+    _COMM = Struct('>hLh')
+    _EXTENDED = Struct('>HQ')
 
     def _parse_tag(self, fh: BinaryIO) -> None:
         header = fh.read(12)
         if header[:4] != b'FORM' or header[8:12] not in {b'AIFC', b'AIFF'}:
             raise ParseError('Invalid AIFF header')
+        # map the ids of the chunks needed for this call to their parsers
+        handlers: dict[bytes, Callable[[BinaryIO, bytes, int], None]] = {}
+        if self._parse_tags:
+            handlers = dict.fromkeys(self._AIFF_MAPPING, self._parse_text)
+            handlers[b'id3 '] = handlers[b'ID3 '] = self._parse_id3
+        if self._parse_duration:
+            handlers[b'COMM'] = self._parse_comm
         header_len = 8
         chunk_header = fh.read(header_len)
         while len(chunk_header) == header_len:
             subchunk_id = chunk_header[:4]
-            subchunk_size = unpack('>I', chunk_header[4:])[0]
+            subchunk_size = self._UINT32.unpack_from(chunk_header, 4)[0]
             # IFF chunks are padded to an even number of bytes
             subchunk_size += subchunk_size % 2
-            if subchunk_id in self._AIFF_MAPPING and self._parse_tags:
-                value = self._unpad(
-                    fh.read(subchunk_size).decode('utf-8', 'replace'))
-                self._set_field(self._AIFF_MAPPING[subchunk_id], value)
-            elif subchunk_id == b'COMM' and self._parse_duration:
-                chunk = fh.read(subchunk_size)
-                channels, num_frames, bitdepth = unpack('>hLh', chunk[:8])
-                self.channels, self.bitdepth = channels, bitdepth
-                try:
-                    # Extended precision
-                    exp, mantissa = unpack('>HQ', chunk[8:18])
-                    sr = int(mantissa * (2 ** (exp - 0x3FFF - 63)))
-                    duration = num_frames / sr
-                    bitrate = sr * channels * bitdepth / 1000
-                    self.samplerate, self.duration, self.bitrate = (
-                        sr, duration, bitrate)
-                except OverflowError:
-                    pass
-            elif subchunk_id in {b'id3 ', b'ID3 '} and self._parse_tags:
-                # pylint: disable=protected-access
-                id3 = _ID3()
-                id3._filehandler = fh
-                id3._load(tags=True, duration=False, image=self._load_image)
-                self._update(id3)
+            handler = handlers.get(subchunk_id)
+            if handler is not None:
+                handler(fh, subchunk_id, subchunk_size)
+                if subchunk_id == b'COMM' and not self._parse_tags:
+                    break  # audio properties are all we need
             else:  # some other chunk, just skip the data
                 fh.seek(subchunk_size, SEEK_CUR)
             chunk_header = fh.read(header_len)
         self._tags_parsed = True
 
+    def _parse_text(self, fh: BinaryIO, chunk_id: bytes, size: int) -> None:
+        value = self._unpad(fh.read(size).decode('utf-8', 'replace'))
+        self._set_field(self._AIFF_MAPPING[chunk_id], value)
+
+    def _parse_comm(self, fh: BinaryIO, _chunk_id: bytes, size: int) -> None:
+        chunk = fh.read(size)
+        channels, num_frames, bitdepth = self._COMM.unpack_from(chunk)
+        self.channels, self.bitdepth = channels, bitdepth
+        try:
+            # Extended precision
+            exp, mantissa = self._EXTENDED.unpack_from(chunk, 8)
+            sr = int(mantissa * (2 ** (exp - 0x3FFF - 63)))
+            duration = num_frames / sr
+            bitrate = sr * channels * bitdepth / 1000
+            self.samplerate, self.duration, self.bitrate = (
+                sr, duration, bitrate)
+        except OverflowError:
+            pass
+
+    def _parse_id3(self, fh: BinaryIO, _chunk_id: bytes, _size: int) -> None:
+        # pylint: disable=protected-access
+        id3 = _ID3()
+        id3._filehandler = fh
+        id3._load(tags=True, duration=False, image=self._load_image)
+        self._update(id3)
+
     def _determine_duration(self, fh: BinaryIO) -> None:
         if not self._tags_parsed:
             self._parse_tag(fh)